@@ -0,0 +1,76 @@
+"""
+Benchmark khởi động: thời gian import main.py và time-to-first-request.
+
+    python bench_startup.py [--runs 5] [--workers 1 2] [--port 8765]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import(runs: int) -> list:
+    """Thời gian `import main` trong process Python mới (giây)"""
+    code = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+    results = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT, stderr=subprocess.DEVNULL)
+        results.append(float(output.decode().strip().splitlines()[-1]))
+    return results
+
+
+def wait_for(url: str, timeout: float) -> bool:
+    """Chờ tới khi server trả về bất kỳ HTTP response nào (không phụ thuộc API key)"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return True
+        except urllib.error.HTTPError:
+            return True
+        except Exception:
+            time.sleep(0.02)
+    return False
+
+
+def measure_first_request(runs: int, workers: int, port: int) -> list:
+    """Từ lúc spawn uvicorn (`workers` process) tới khi /health trả lời (giây)"""
+    results = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            if not wait_for(f"http://127.0.0.1:{port}/health", timeout=60):
+                raise RuntimeError("Server không sẵn sàng sau 60s")
+            results.append(time.perf_counter() - started)
+        finally:
+            server.terminate()
+            server.wait()
+    return results
+
+
+def report(name: str, values: list):
+    print(f"{name}: median {statistics.median(values):.3f}s  min {min(values):.3f}s  max {max(values):.3f}s  (n={len(values)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    
+    report("import main", measure_import(args.runs))
+    for workers in args.workers:
+        report(f"time-to-first-request ({workers} worker)", measure_first_request(args.runs, workers, args.port))
@@ -193,7 +193,8 @@ export default function AISectionSelected() {
                 buffer = parts.pop() || '';
 
                 for (const part of parts) {
-                    const line = part.trim();
+                    // drop the SSE `id:` field, keep the `data:` line
+                    const line = part.split('\n').filter(l => !l.startsWith('id: ')).join('\n').trim();
                     if (!line) continue;
                     // expect lines like: data: {json}
                     if (line.startsWith('data: ')) {
@@ -254,7 +255,7 @@ export default function AISectionSelected() {
             if (buffer.trim()) {
                 const lines = buffer.split('\n\n');
                 for (const l of lines) {
-                    const line = l.trim();
+                    const line = l.split('\n').filter(x => !x.startsWith('id: ')).join('\n').trim();
                     if (!line) continue;
                     if (line.startsWith('data: ')) {
                         try {